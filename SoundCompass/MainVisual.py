@@ -1,18 +1,24 @@
 import pygame
 import sys
-import math
 import os
 import socket
-import threading
+import selectors
+import logging
+import collections
+from pygame.math import Vector2
 
 pygame.init()
 
 WIDTH, HEIGHT = 1024, 768
+CX, CY = WIDTH // 2, HEIGHT // 2
+CENTER = (CX, CY)  # everything is drawn centered here
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("PD + Interactive Animations")
 
 WHITE = (255, 255, 255)
 clock = pygame.time.Clock()
+FPS = 60
+IDLE_FPS = 30
 
 # Double-click variables
 last_click_time = 0
@@ -24,23 +30,80 @@ fullscreen = False
 # --------------------------------------------------------------------------------
 HOST, PORT = "localhost", 13001
 
-# param_images structure: param -> {"active": bool, "images": [(surf, rect), ...]}
-param_images = {}
+# Per-message logging is debug level so nothing is formatted or written while PD is chatty
+logger = logging.getLogger("pd")
+logger.setLevel(logging.WARNING)
+
+# Params are stored as parallel lists indexed by param_idx[name]:
+#   param_active  - last state PD sent
+#   param_visible - state the render loop draws; only changes when a queued
+#                   transition is drained at the top of a frame
+#   param_sprites - the param's line/dot sprites
+param_names = []
+param_idx = {}
+param_active = []
+param_visible = []
+param_sprites = []
+_pending = collections.deque()  # (index, is_active) transitions not yet drawn
+lines_group = pygame.sprite.LayeredDirty()  # every line/dot sprite, in param order
+active_sprites = []  # visible sprites, rebuilt on transitions
+
+class LinesSprite(pygame.sprite.DirtySprite):
+    """One PD line/dot image, visible while its param is active."""
+    def __init__(self, surf, rect):
+        super().__init__()
+        self.source = surf  # unscaled image
+        self.image = surf
+        self.rect = rect
+        self.visible = 0
+        # Always redrawn when drawn at all: the main loop clips each redraw to
+        # the area that changed and repaints every layer inside it
+        self.dirty = 2
+
+    def scale_to(self, scale):
+        self.image = cached_transform(self.source, scale)
+        self.rect = self.image.get_rect(center=CENTER)
+        if self.image is self.source:
+            self.release_scaled()
+
+    def release_scaled(self):
+        """Drops the cached scaled copy (up to ~78 MB at 5x) and shows the source."""
+        _xform_cache.pop(id(self.source), None)
+        self.image = self.source
+        self.rect = self.image.get_rect(center=CENTER)
 
 def load_image_centered(filename):
     """Loads an image from 'Assets/filename' and returns (surf, rect) centered."""
     path = os.path.join("Assets", filename)
-    surf = pygame.image.load(path).convert_alpha()
-    rect = surf.get_rect(center=(WIDTH//2, HEIGHT//2))
+    surf = pygame.image.load(path).convert_alpha(screen)
+    rect = surf.get_rect(center=CENTER)
     return surf, rect
 
+def rebuild_active_sprites():
+    """Updates sprite visibility from param_visible and lists the visible ones."""
+    global active_sprites
+    active_sprites = []
+    for i in range(len(param_names)):
+        visible = param_visible[i]
+        for sprite in param_sprites[i]:
+            sprite.visible = int(visible)
+            if visible:
+                active_sprites.append(sprite)
+            else:
+                sprite.release_scaled()
+
 def add_param_images(param, *filenames):
     """Adds multiple images (lines/dots) to one param (e.g., 'notes')."""
-    img_list = []
+    sprites = []
     for f in filenames:
         s, r = load_image_centered(f)
-        img_list.append((s, r))
-    param_images[param] = {"active": False, "images": img_list}
+        sprites.append(LinesSprite(s, r))
+    lines_group.add(*sprites)
+    param_idx[param] = len(param_names)
+    param_names.append(param)
+    param_active.append(False)
+    param_visible.append(False)
+    param_sprites.append(sprites)
 
 # Fill out the mapping:
 add_param_images("notes",    "VisualDot.png", "VisualLine.png")
@@ -50,37 +113,88 @@ add_param_images("drumBeat", "MindDot.png",   "MindLine.png")
 add_param_images("ambient",  "TasteDot.png",  "TasteLine.png")
 add_param_images("rythmn",   "TouchDot.png",  "TouchLine.png", "GeneralLine.png")
 
-def pd_server_thread():
-    """Background thread that receives PD messages like 'notes 1' or 'drumBeat 0'."""
+# The PD socket is polled from the main loop instead of a background thread.
+sel = selectors.DefaultSelector()
+
+# Shared receive buffer; data is copied out to each connection's pending bytes
+_recv_buf = bytearray(8192)
+_recv_view = memoryview(_recv_buf)
+
+def pd_server_start():
+    """Opens the non-blocking PD listener; clients are accepted in pd_poll()."""
     sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.bind((HOST, PORT))
+    # Allow rebinding right after a restart while the old port is in TIME_WAIT;
+    # accepted connections inherit the larger receive buffer
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 64 * 1024)
+    try:
+        sock.bind((HOST, PORT))
+    except OSError as e:
+        sock.close()
+        logger.error("Could not listen on %s:%s: %s", HOST, PORT, e)
+        return
     sock.listen(1)
-    print(f"[PD Server] Listening on {HOST}:{PORT}")
-
-    while True:
-        connection, client_address = sock.accept()
-        print(f"[PD Server] Client connected: {client_address}")
+    sock.setblocking(False)
+    sel.register(sock, selectors.EVENT_READ)  # data=None marks the listener
+    logger.info("Listening on %s:%s", HOST, PORT)
+
+# Unknown param names are only warned about once
+_warned_params = set()
+
+# Bytes stripped from a message before it is split into 'param value'
+_STRIP_BYTES = b'\n\r\t;'
+
+def handle_pd_message(data):
+    """Applies one PD message like 'notes 1' or 'drumBeat 0'."""
+    parts = data.translate(None, _STRIP_BYTES).split()
+    logger.debug("Received: %s", parts)
+    if len(parts) == 2:
+        param_name = parts[0].decode("utf-8", "replace")
+        is_active = (parts[1] == b"1")
+        i = param_idx.get(param_name)
+        if i is not None:
+            # PD repeats states; only queue actual changes
+            if param_active[i] != is_active:
+                param_active[i] = is_active
+                _pending.append((i, is_active))
+        elif param_name not in _warned_params:
+            _warned_params.add(param_name)
+            logger.warning("Unknown param: %s", param_name)
+
+def pd_poll():
+    """Accepts PD clients and handles whatever messages are ready, without blocking."""
+    for key, _ in sel.select(timeout=0):
+        if key.data is None:
+            connection, client_address = key.fileobj.accept()
+            connection.setblocking(False)
+            connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # Per-connection buffer holding a partially received message
+            sel.register(connection, selectors.EVENT_READ, bytearray())
+            logger.info("Client connected: %s", client_address)
+            continue
+
+        connection, pending = key.fileobj, key.data
         try:
-            while True:
-                data = connection.recv(128)
-                if not data:
-                    break
-                msg = data.decode("utf-8").replace('\n','').replace('\r','').replace('\t','').replace(';','')
-                print(f"[PD Server] Received: {msg}")
-                parts = msg.split()
-                if len(parts) == 2:
-                    param_name, value_str = parts
-                    is_active = (value_str == "1")
-                    if param_name in param_images:
-                        param_images[param_name]["active"] = is_active
-                    else:
-                        print(f"Unknown param: {param_name}")
-        finally:
+            n = connection.recv_into(_recv_view)
+        except BlockingIOError:
+            continue
+        except OSError:
+            n = 0
+        if n == 0:
+            sel.unregister(connection)
             connection.close()
+            continue
+
+        # Messages end with ';' and/or a newline; keep the unterminated tail
+        pending += _recv_view[:n]
+        end = max(pending.rfind(b";"), pending.rfind(b"\n")) + 1
+        if end:
+            for frame in pending[:end].replace(b"\n", b";").split(b";"):
+                if frame.strip():
+                    handle_pd_message(frame)
+            del pending[:end]
 
-# Start PD server thread
-thread = threading.Thread(target=pd_server_thread, daemon=True)
-thread.start()
+pd_server_start()
 
 # --------------------------------------------------------------------------------
 # 2) Interactive Animation Setup (Arcs, Gauge, Handle, etc.)
@@ -96,6 +210,40 @@ thinarc_surf, thinarc_rect   = load_image_centered("ThinArc.png")
 gauge_surf, gauge_rect = load_image_centered("Gauge.png")
 handle_surf, handle_rect = load_image_centered("Handle.png")
 
+def scaled_copy(surf, scale):
+    w, h = surf.get_size()
+    return pygame.transform.scale(surf, (int(w * scale), int(h * scale)))
+
+# Rotation lookup tables in 1 degree steps, kept as small LRUs: a full table of
+# these surfaces is close to a gigabyte each, and one drag visits every angle.
+ROT_LUT_SIZE = 4  # rotated surfaces kept per table (~3 MB each)
+
+def build_rotation_luts():
+    """(Re)creates the empty handle LUT and the gauge LUTs for its resting
+    scales (idle 1.0, dragging 1.1), stored as scale -> (surf, lut)."""
+    global handle_rot_lut, gauge_rot_luts
+    handle_rot_lut = collections.OrderedDict()
+    gauge_rot_luts = {
+        1.0: (gauge_surf, collections.OrderedDict()),
+        1.1: (scaled_copy(gauge_surf, 1.1), collections.OrderedDict()),
+    }
+
+build_rotation_luts()
+
+def lut_rotate(lut, surf, angle):
+    """Returns 'surf' rotated clockwise by 'angle' rounded to whole degrees."""
+    i = int(round(angle)) % 360
+    if i == 0:
+        return surf
+    rotated = lut.get(i)
+    if rotated is None:
+        rotated = lut[i] = pygame.transform.rotate(surf, -i)
+        if len(lut) > ROT_LUT_SIZE:
+            lut.popitem(last=False)
+    else:
+        lut.move_to_end(i)
+    return rotated
+
 arc_scale_current  = 1.0
 arc_scale_target   = 1.0
 gauge_scale_current = 1.0
@@ -104,49 +252,152 @@ gauge_angle         = 0.0
 gauge_rot_speed_factor = 2.0
 handle_angle = 0.0
 
-SNAP_ANGLES = [90, 180]
+SNAP_ANGLES = (90.0, 180.0)  # the handle rests at one of these two
 
-lines_scale_factor = 1.0
+# The lines scale is counted in whole 0.01 steps above 1.0 so it never drifts,
+# and drawn quantized to 0.02 bins so the scaled surfaces can be cached
+lines_scale_steps = 0
 MAX_SCALE = 5.0
+MAX_SCALE_STEPS = int(round((MAX_SCALE - 1.0) * 100))
+LINES_SCALE_BINS = 50  # bins per 1.0 of scale
 
 dragging = False
 old_angle = 0.0
 
-def get_mouse_angle(mx, my):
-    dx = mx - (WIDTH // 2)
-    dy = my - (HEIGHT // 2)
-    angle_rads = math.atan2(dy, dx)
-    return math.degrees(angle_rads)
+_CENTER_V = Vector2(CENTER)
 
-def snap_to_nearest_angle(angle, angle_list):
-    return min(angle_list, key=lambda a: abs(a - angle))
+def get_mouse_angle(mx, my):
+    """Angle of the mouse around the center in degrees, as atan2(dy, dx)."""
+    return (Vector2(mx, my) - _CENTER_V).as_polar()[1]
 
 def smooth_approach(current, target, factor=0.2):
+    if abs(target - current) < 1e-3:
+        return target
     return current + (target - current) * factor
 
+# Last transform per source surface: id(surf) -> ((scale_key, angle_key), result)
+_xform_cache = {}
+
+def cached_transform(surf, scale=None, angle=None):
+    """Scales and/or rotates 'surf', reusing the previous result while the
+    scale (3 decimals) and angle (0.1 degree) stay the same. Steps that would
+    leave the image pixel-equivalent are skipped."""
+    if scale is not None and abs(scale - 1.0) < 1e-3:
+        scale = None
+    if angle is not None and abs((angle + 180) % 360 - 180) < 0.5:
+        angle = None
+    if scale is None and angle is None:
+        return surf
+
+    key = (None if scale is None else int(round(scale * 1000)),
+           None if angle is None else int(round(angle * 10)))
+    cached = _xform_cache.get(id(surf))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    result = surf
+    if scale is not None:
+        result = scaled_copy(result, scale)
+    if angle is not None:
+        result = pygame.transform.rotate(result, angle)
+    _xform_cache[id(surf)] = (key, result)
+    return result
+
+def build_background():
+    """Composites the static mask and circles once: overlay_surf goes over the
+    PD lines, background_surf is the opaque version drawn when none are shown."""
+    global overlay_surf, background_surf
+    overlay_surf = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha(screen)
+    overlay_surf.fill((0, 0, 0, 0))
+    overlay_surf.blit(mask_surf, mask_rect)
+    overlay_surf.blit(boldcircle_surf, boldcircle_rect)
+    overlay_surf.blit(thincircle_surf, thincircle_rect)
+
+    background_surf = pygame.Surface((WIDTH, HEIGHT)).convert(screen)
+    background_surf.fill(WHITE)
+    background_surf.blit(overlay_surf, (0, 0))
+
+build_background()
+screen_rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
+
+def reconvert_surfaces():
+    """Converts every loaded surface to the current display format again after
+    set_mode, and drops the transforms made from the old surfaces."""
+    global mask_surf, boldcircle_surf, thincircle_surf
+    global thickarc_surf, thinarc_surf, gauge_surf, handle_surf
+    for sprites in param_sprites:
+        for sprite in sprites:
+            sprite.source = sprite.image = sprite.source.convert_alpha(screen)
+    mask_surf       = mask_surf.convert_alpha(screen)
+    boldcircle_surf = boldcircle_surf.convert_alpha(screen)
+    thincircle_surf = thincircle_surf.convert_alpha(screen)
+    thickarc_surf   = thickarc_surf.convert_alpha(screen)
+    thinarc_surf    = thinarc_surf.convert_alpha(screen)
+    gauge_surf      = gauge_surf.convert_alpha(screen)
+    handle_surf     = handle_surf.convert_alpha(screen)
+    _xform_cache.clear()
+    build_rotation_luts()
+    build_background()
+
+def toggle_fullscreen():
+    """Toggles fullscreen in place so the display surface (and the format our
+    surfaces were converted to) is kept. Where the platform can't do that, the
+    mode is set again and the surfaces are re-converted for it."""
+    global screen, fullscreen
+    # toggle_fullscreen() returns 0 on success and -1 when it skips the toggle
+    # (e.g. on Wayland); other failures raise pygame.error
+    try:
+        toggled = pygame.display.toggle_fullscreen() != -1
+    except pygame.error:
+        toggled = False
+
+    if toggled:
+        screen = pygame.display.get_surface()
+    else:
+        flags = 0 if fullscreen else pygame.FULLSCREEN
+        screen = pygame.display.set_mode((WIDTH, HEIGHT), flags)
+        reconvert_surfaces()
+    fullscreen = not fullscreen
+
+def changed_rects(prev_layers, layers):
+    """Rects of layers that appeared, disappeared, moved or changed surface."""
+    prev = {(id(surf), tuple(rect)): rect for surf, rect in prev_layers}
+    cur = {(id(surf), tuple(rect)): rect for surf, rect in layers}
+    return [rect for key, rect in prev.items() if key not in cur] + \
+           [rect for key, rect in cur.items() if key not in prev]
+
 # --------------------------------------------------------------------------------
 # Main Loop
 # --------------------------------------------------------------------------------
+prev_layers = []
+full_redraw = True  # first frame, fullscreen toggles and window exposes
+
 running = True
 while running:
     now = pygame.time.get_ticks()  # to check double-click timing
 
+    pd_poll()
+    if _pending:
+        while _pending:
+            i, is_active = _pending.popleft()
+            param_visible[i] = is_active
+        rebuild_active_sprites()
+
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
             running = False
 
+        elif event.type == pygame.VIDEOEXPOSE:
+            full_redraw = True
+
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:
                 # Check for double-click
                 time_since_last_click = now - last_click_time
                 if time_since_last_click < DOUBLE_CLICK_TIME:
                     # Double-click detected => toggle fullscreen
-                    if not fullscreen:
-                        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.FULLSCREEN)
-                        fullscreen = True
-                    else:
-                        screen = pygame.display.set_mode((WIDTH, HEIGHT))
-                        fullscreen = False
+                    toggle_fullscreen()
+                    full_redraw = True
                 last_click_time = now
 
                 # Single-click dragging logic
@@ -161,31 +412,25 @@ while running:
                 dragging = False
                 arc_scale_target   = 1.0
                 gauge_scale_target = 1.0
-                handle_angle = snap_to_nearest_angle(handle_angle, SNAP_ANGLES)
+                snap_a, snap_b = SNAP_ANGLES
+                handle_angle = snap_a if abs(handle_angle - snap_a) <= abs(handle_angle - snap_b) else snap_b
 
         elif event.type == pygame.MOUSEMOTION:
             if dragging:
                 mx, my = event.pos
                 new_angle = get_mouse_angle(mx, my)
-                delta_angle = new_angle - old_angle
-
-                if delta_angle > 180:
-                    delta_angle -= 360
-                elif delta_angle < -180:
-                    delta_angle += 360
+                # Wrap into [-180, 180) when crossing the +/-180 boundary
+                delta_angle = (new_angle - old_angle + 180) % 360 - 180
 
                 handle_angle += delta_angle
                 gauge_angle += delta_angle * gauge_rot_speed_factor
 
                 if delta_angle < 0:
-                    lines_scale_factor += 0.01
+                    lines_scale_steps += 1
                 elif delta_angle > 0:
-                    lines_scale_factor -= 0.01
+                    lines_scale_steps -= 1
 
-                if lines_scale_factor < 1.0:
-                    lines_scale_factor = 1.0
-                if lines_scale_factor > MAX_SCALE:
-                    lines_scale_factor = MAX_SCALE
+                lines_scale_steps = min(MAX_SCALE_STEPS, max(0, lines_scale_steps))
 
                 old_angle = new_angle
 
@@ -193,60 +438,67 @@ while running:
     arc_scale_current    = smooth_approach(arc_scale_current, arc_scale_target, 0.2)
     gauge_scale_current  = smooth_approach(gauge_scale_current, gauge_scale_target, 0.2)
 
-    screen.fill(WHITE)
-
-    # 1) PD lines/dots (beneath everything else)
-    for param_name, info in param_images.items():
-        if info["active"]:
-            for (surf, rect) in info["images"]:
-                if lines_scale_factor != 1.0:
-                    orig_w, orig_h = surf.get_size()
-                    new_w = int(orig_w * lines_scale_factor)
-                    new_h = int(orig_h * lines_scale_factor)
-                    lines_surf = pygame.transform.scale(surf, (new_w, new_h))
-                    lines_rect = lines_surf.get_rect(center=(WIDTH//2, HEIGHT//2))
-                    screen.blit(lines_surf, lines_rect)
-                else:
-                    screen.blit(surf, rect)
-
-    # 2) Mask, circles (no scaling)
-    screen.blit(mask_surf, mask_rect)
-    screen.blit(boldcircle_surf, boldcircle_rect)
-    screen.blit(thincircle_surf, thincircle_rect)
+    # 1) PD lines/dots (beneath everything else), drawn through lines_group
+    lines_bin = (100 + lines_scale_steps) * LINES_SCALE_BINS // 100
+    for sprite in active_sprites:
+        sprite.scale_to(lines_bin / LINES_SCALE_BINS)
+    lines_visible = bool(active_sprites)
 
-    # 3) Gauge (scaled + rotated)
-    gw, gh = gauge_surf.get_size()
-    new_gw = int(gw * gauge_scale_current)
-    new_gh = int(gh * gauge_scale_current)
-    gauge_scaled = pygame.transform.scale(gauge_surf, (new_gw, new_gh))
-    gauge_scaled_rect = gauge_scaled.get_rect(center=(WIDTH//2, HEIGHT//2))
+    # Collect the other layers in draw order as (surf, rect)
+    layers = []
 
-    gauge_rotated = pygame.transform.rotate(gauge_scaled, -gauge_angle)
-    gauge_rot_rect = gauge_rotated.get_rect(center=(WIDTH//2, HEIGHT//2))
-    screen.blit(gauge_rotated, gauge_rot_rect)
+    # 2) Mask, circles (pre-composited; part of the opaque background if no lines)
+    if lines_visible:
+        layers.append((overlay_surf, screen_rect))
+
+    # 3) Gauge (scaled + rotated)
+    gauge_lut = gauge_rot_luts.get(gauge_scale_current)
+    if gauge_lut is not None:
+        gauge_rotated = lut_rotate(gauge_lut[1], gauge_lut[0], gauge_angle)
+    else:
+        gauge_rotated = cached_transform(gauge_surf, gauge_scale_current, -gauge_angle)
+    gauge_rot_rect = gauge_rotated.get_rect(center=CENTER)
+    layers.append((gauge_rotated, gauge_rot_rect))
 
     # 4) ThickArc & ThinArc (scaled)
-    tw, th = thickarc_surf.get_size()
-    arcw   = int(tw * arc_scale_current)
-    arch   = int(th * arc_scale_current)
-    thickarc_scaled = pygame.transform.scale(thickarc_surf, (arcw, arch))
-    thickarc_rect = thickarc_scaled.get_rect(center=(WIDTH//2, HEIGHT//2))
-    screen.blit(thickarc_scaled, thickarc_rect)
-
-    tw2, th2 = thinarc_surf.get_size()
-    arcw2   = int(tw2 * arc_scale_current)
-    arch2   = int(th2 * arc_scale_current)
-    thinarc_scaled = pygame.transform.scale(thinarc_surf, (arcw2, arch2))
-    thinarc_rect = thinarc_scaled.get_rect(center=(WIDTH//2, HEIGHT//2))
-    screen.blit(thinarc_scaled, thinarc_rect)
+    thickarc_scaled = cached_transform(thickarc_surf, arc_scale_current)
+    thickarc_rect = thickarc_scaled.get_rect(center=CENTER)
+    layers.append((thickarc_scaled, thickarc_rect))
 
-    # 5) Handle (rotated)
-    rotated_handle = pygame.transform.rotate(handle_surf, -handle_angle)
-    handle_rect = rotated_handle.get_rect(center=(WIDTH//2, HEIGHT//2))
-    screen.blit(rotated_handle, handle_rect)
+    thinarc_scaled = cached_transform(thinarc_surf, arc_scale_current)
+    thinarc_rect = thinarc_scaled.get_rect(center=CENTER)
+    layers.append((thinarc_scaled, thinarc_rect))
 
-    pygame.display.flip()
-    clock.tick(60)
+    # 5) Handle (rotated)
+    rotated_handle = lut_rotate(handle_rot_lut, handle_surf, handle_angle)
+    handle_rect = rotated_handle.get_rect(center=CENTER)
+    layers.append((rotated_handle, handle_rect))
+
+    # Redraw only the area covered by layers that changed since the last frame
+    frame_layers = [(sprite.image, sprite.rect) for sprite in active_sprites] + layers
+    if full_redraw:
+        dirty_rects = [screen_rect]
+        full_redraw = False
+    else:
+        dirty_rects = changed_rects(prev_layers, frame_layers)
+    prev_layers = frame_layers
+
+    if dirty_rects:
+        dirty = dirty_rects[0].unionall(dirty_rects[1:]).clip(screen_rect)
+        screen.set_clip(dirty)
+        if lines_visible:
+            screen.fill(WHITE)
+            lines_group.draw(screen)
+        else:
+            screen.blit(background_surf, dirty, dirty)
+        for surf, rect in layers:
+            screen.blit(surf, rect)
+        screen.set_clip(None)
+        pygame.display.update(dirty)
+
+    # Nothing moved and no drag in progress: poll at a lower rate
+    is_idle = not dragging and not dirty_rects
+    clock.tick(IDLE_FPS if is_idle else FPS)
 
 pygame.quit()
 sys.exit()